@@ -10,6 +10,7 @@ Usage:
 import os
 import sys
 import gzip
+import mmap
 from pathlib import Path
 
 # Add parent directory to path for development testing
@@ -39,6 +40,8 @@ def main():
 
     print(f"\nTest file: {test_file}")
 
+    input_mm = None
+    input_data = None
     try:
         # 1. Initialize
         print("\n1. Initializing GaussForge...")
@@ -53,12 +56,15 @@ def main():
         # 3. Get supported formats
         print("\n3. Getting supported formats...")
         formats = gf.get_supported_formats()
+        supported = frozenset(formats)
         print(f"   Supported formats: {', '.join(formats)}")
 
         # 4. Read test file
         print("\n4. Reading test file...")
+        # Map the file instead of reading it; the bindings accept any buffer
         with open(test_file, "rb") as f:
-            input_data = f.read()
+            input_mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        input_data = memoryview(input_mm)
         print(f"   File size: {len(input_data)} bytes")
 
         read_result = gf.read(input_data, "ply")
@@ -122,7 +128,7 @@ def main():
         output_formats = ["splat", "ksplat", "spz", "ply", "compressed.ply", "sog"]
 
         for out_format in output_formats:
-            if out_format not in formats:
+            if out_format not in supported:
                 print(f"   Skipping {out_format} (not supported)")
                 continue
 
@@ -179,6 +185,12 @@ def main():
 
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        # The view must be released before the map it points into can close
+        if input_data is not None:
+            input_data.release()
+        if input_mm is not None:
+            input_mm.close()
 
 
 if __name__ == "__main__":
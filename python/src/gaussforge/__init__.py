@@ -26,7 +26,32 @@ Example:
             f.write(converted["data"])
 """
 
-from gaussforge._core import GaussForge, get_version
+import functools
+
+from gaussforge._core import GaussForge as _NativeGaussForge, get_version, pack_ply
 
 __version__ = get_version()
-__all__ = ["GaussForge", "get_version", "__version__"]
+
+
+@functools.lru_cache(maxsize=None)
+def _supported_formats():
+    return tuple(_NativeGaussForge().get_supported_formats())
+
+
+class GaussForge(_NativeGaussForge):
+    """Main class for Gaussian Splatting format conversion.
+
+    Process-wide constants (version, supported formats) are answered from a
+    cache instead of crossing into the native module on every call.
+    """
+
+    def get_supported_formats(self):
+        """Get list of supported format names."""
+        return list(_supported_formats())
+
+    def get_version(self):
+        """Get library version string."""
+        return __version__
+
+
+__all__ = ["GaussForge", "get_version", "pack_ply", "__version__"]
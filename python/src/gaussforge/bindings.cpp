@@ -1,9 +1,11 @@
 #include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
 #include <nanobind/stl/string.h>
 #include <nanobind/stl/vector.h>
 #include <nanobind/stl/unordered_map.h>
 
 #include <cstdint>
+#include <cstring>
 #include <memory>
 #include <string>
 #include <vector>
@@ -18,6 +20,30 @@ namespace nb = nanobind;
 
 namespace {
 
+/**
+ * Read-only view over any object exposing the buffer protocol
+ * (bytes, bytearray, memoryview, mmap, NumPy arrays) without copying
+ */
+class ByteView {
+public:
+    explicit ByteView(nb::handle obj) {
+        if (PyObject_GetBuffer(obj.ptr(), &view_, PyBUF_SIMPLE) != 0)
+            throw nb::python_error();
+    }
+    ~ByteView() { PyBuffer_Release(&view_); }
+
+    ByteView(const ByteView &) = delete;
+    ByteView &operator=(const ByteView &) = delete;
+
+    const uint8_t *data() const {
+        return static_cast<const uint8_t *>(view_.buf);
+    }
+    size_t size() const { return static_cast<size_t>(view_.len); }
+
+private:
+    Py_buffer view_;
+};
+
 /**
  * Convert GaussianCloudIR to Python dict
  * Returns bytes for float arrays (zero-copy friendly)
@@ -188,6 +214,102 @@ nb::dict modelInfoToPy(const gf::ModelInfo &info) {
     return result;
 }
 
+/**
+ * Build the {"error": message} result dict returned on failure
+ */
+nb::dict err(const std::string &m) {
+    nb::dict e;
+    e["error"] = m;
+    return e;
+}
+
+using FloatArray =
+    nb::ndarray<const float, nb::c_contig, nb::device::cpu>;
+
+/**
+ * Interleave per-point arrays into binary PLY vertex records laid out as
+ * x, y, z, nx, ny, nz, f_dc_0..2, f_rest_0..K-1, opacity, scale_0..2,
+ * rot_0..3 (normals are written as zeros, matching PlyWriter)
+ */
+void packPlyRecords(size_t n, size_t restDim, const float *__restrict__ pos,
+                    const float *__restrict__ fdc,
+                    const float *__restrict__ rest,
+                    const float *__restrict__ opacity,
+                    const float *__restrict__ scale,
+                    const float *__restrict__ rot, float *__restrict__ out) {
+    const size_t D = 17 + restDim;
+    for (size_t i = 0; i < n; i++) {
+        float *__restrict__ rec = out + i * D;
+        const size_t i3 = i * 3;
+        const size_t i4 = i * 4;
+
+        rec[0] = pos[i3 + 0];
+        rec[1] = pos[i3 + 1];
+        rec[2] = pos[i3 + 2];
+        rec[3] = 0.0f;
+        rec[4] = 0.0f;
+        rec[5] = 0.0f;
+        rec[6] = fdc[i3 + 0];
+        rec[7] = fdc[i3 + 1];
+        rec[8] = fdc[i3 + 2];
+        if (restDim > 0)
+            std::memcpy(rec + 9, rest + i * restDim, restDim * sizeof(float));
+
+        float *__restrict__ tail = rec + 9 + restDim;
+        tail[0] = opacity[i];
+        tail[1] = scale[i3 + 0];
+        tail[2] = scale[i3 + 1];
+        tail[3] = scale[i3 + 2];
+        tail[4] = rot[i4 + 0];
+        tail[5] = rot[i4 + 1];
+        tail[6] = rot[i4 + 2];
+        tail[7] = rot[i4 + 3];
+    }
+}
+
+/**
+ * Pack float32 NumPy arrays into PLY vertex records (body only, no header)
+ */
+nb::dict packPly(FloatArray positions, FloatArray fDc, FloatArray fRest,
+                 FloatArray opacity, FloatArray scales,
+                 FloatArray rotations) {
+    const size_t n = positions.ndim() == 2 ? positions.shape(0) : 0;
+    auto hasShape = [n](const FloatArray &a, size_t cols) {
+        return a.ndim() == 2 && a.shape(0) == n && a.shape(1) == cols;
+    };
+    if (positions.ndim() != 2 || positions.shape(1) != 3)
+        return err("positions must have shape (n, 3)");
+    if (!hasShape(fDc, 3))
+        return err("f_dc must have shape (n, 3)");
+    if (fRest.ndim() != 2 || fRest.shape(0) != n)
+        return err("f_rest must have shape (n, k)");
+    if (opacity.ndim() != 1 || opacity.shape(0) != n)
+        return err("opacity must have shape (n,)");
+    if (!hasShape(scales, 3))
+        return err("scales must have shape (n, 3)");
+    if (!hasShape(rotations, 4))
+        return err("rotations must have shape (n, 4)");
+
+    const size_t restDim = fRest.shape(1);
+    const size_t size = n * (17 + restDim) * sizeof(float);
+
+    // Pack straight into the bytes object to avoid an extra copy
+    nb::bytes data = nb::steal<nb::bytes>(
+        PyBytes_FromStringAndSize(nullptr, static_cast<Py_ssize_t>(size)));
+    if (!data.is_valid())
+        throw nb::python_error();
+    float *out = reinterpret_cast<float *>(PyBytes_AS_STRING(data.ptr()));
+    {
+        nb::gil_scoped_release release;
+        packPlyRecords(n, restDim, positions.data(), fDc.data(), fRest.data(),
+                       opacity.data(), scales.data(), rotations.data(), out);
+    }
+
+    nb::dict res;
+    res["data"] = data;
+    return res;
+}
+
 } // namespace
 
 /**
@@ -197,12 +319,12 @@ class GaussForgePy {
 public:
     GaussForgePy() : registry_(std::make_unique<gf::IORegistry>()) {}
 
-    nb::dict read(nb::bytes pyData, const std::string &format,
+    nb::dict read(nb::handle pyData, const std::string &format,
                   bool strict = false) {
         try {
-            const uint8_t *data =
-                reinterpret_cast<const uint8_t *>(pyData.c_str());
-            size_t size = pyData.size();
+            ByteView view(pyData);
+            const uint8_t *data = view.data();
+            size_t size = view.size();
 
             auto *reader = registry_->ReaderForExt(format);
             if (!reader)
@@ -221,6 +343,8 @@ public:
             if (!validation.message.empty())
                 res["warning"] = validation.message;
             return res;
+        } catch (const nb::python_error &) {
+            throw; // e.g. TypeError for a non-buffer data argument
         } catch (const std::exception &e) {
             return err(e.what());
         }
@@ -248,7 +372,7 @@ public:
         }
     }
 
-    nb::dict convert(nb::bytes pyData, const std::string &inFormat,
+    nb::dict convert(nb::handle pyData, const std::string &inFormat,
                      const std::string &outFormat, bool strict = false,
                      uint32_t spz_version = 3) {
         try {
@@ -257,9 +381,9 @@ public:
             if (!reader || !writer)
                 return err("Format handler not found");
 
-            const uint8_t *data =
-                reinterpret_cast<const uint8_t *>(pyData.c_str());
-            size_t size = pyData.size();
+            ByteView view(pyData);
+            const uint8_t *data = view.data();
+            size_t size = view.size();
 
             auto ir_or = reader->Read(data, size, {strict});
             if (!ir_or)
@@ -274,6 +398,8 @@ public:
                 reinterpret_cast<const char *>(out_or.value().data()),
                 out_or.value().size());
             return res;
+        } catch (const nb::python_error &) {
+            throw; // e.g. TypeError for a non-buffer data argument
         } catch (const std::exception &e) {
             return err(e.what());
         }
@@ -286,12 +412,12 @@ public:
         return formats;
     }
 
-    nb::dict getModelInfo(nb::bytes pyData, const std::string &format,
+    nb::dict getModelInfo(nb::handle pyData, const std::string &format,
                           size_t fileSize = 0) {
         try {
-            const uint8_t *data =
-                reinterpret_cast<const uint8_t *>(pyData.c_str());
-            size_t size = pyData.size();
+            ByteView view(pyData);
+            const uint8_t *data = view.data();
+            size_t size = view.size();
 
             auto *reader = registry_->ReaderForExt(format);
             if (!reader)
@@ -306,6 +432,8 @@ public:
             nb::dict res;
             res["data"] = modelInfoToPy(info);
             return res;
+        } catch (const nb::python_error &) {
+            throw; // e.g. TypeError for a non-buffer data argument
         } catch (const std::exception &e) {
             return err(e.what());
         }
@@ -315,12 +443,6 @@ public:
 
 private:
     std::unique_ptr<gf::IORegistry> registry_;
-
-    nb::dict err(const std::string &m) {
-        nb::dict e;
-        e["error"] = m;
-        return e;
-    }
 };
 
 NB_MODULE(_core, m) {
@@ -333,8 +455,8 @@ NB_MODULE(_core, m) {
         .def(nb::init<>(), "Create a new GaussForge instance")
         .def("read", &GaussForgePy::read, nb::arg("data"), nb::arg("format"),
              nb::arg("strict") = false,
-             "Read Gaussian data from bytes. Returns dict with 'data' or "
-             "'error'.")
+             "Read Gaussian data from a bytes-like object. Returns dict with "
+             "'data' or 'error'.")
         .def("write", &GaussForgePy::write, nb::arg("ir"), nb::arg("format"),
              nb::arg("strict") = false, nb::arg("spz_version") = 3,
              "Write Gaussian IR to bytes. Returns dict with 'data' or 'error'.")
@@ -351,6 +473,12 @@ NB_MODULE(_core, m) {
         .def("get_version", &GaussForgePy::getVersion,
              "Get library version string.");
 
+    m.def("pack_ply", &packPly, nb::arg("positions"), nb::arg("f_dc"),
+          nb::arg("f_rest"), nb::arg("opacity"), nb::arg("scales"),
+          nb::arg("rotations"),
+          "Interleave float32 arrays into binary PLY vertex records (no "
+          "header). Returns dict with 'data' or 'error'.");
+
     // Module-level convenience function
     m.def(
         "get_version", []() { return std::string(GAUSS_FORGE_VERSION_STRING); },
@@ -4,17 +4,18 @@ Generate 3D Gaussian PLY by rendering text with PIL and using pixel coordinates.
 Glyphs come from real fonts; no manual coordinates. Output is GaussForge-compatible (includes f_rest_0..44).
 
 Dependencies: pip install numpy pillow
+Optional: pip install numba   # parallel JIT packing of the PLY body
 
 Usage:
   python3 text_to_gaussian_ply_pil.py -o output_gaussians.ply
   python3 text_to_gaussian_ply_pil.py -o out.ply --step 3 --color-top "#87CEEB" --color-bottom "#FFD700"
   python3 text_to_gaussian_ply_pil.py -o out.ply --step 2 --color "#FFFFFF"   # solid color, no gradient
+  python3 text_to_gaussian_ply_pil.py -o out.compressed.ply   # chunk-quantized compressed PLY
 Default: step=2 (sparse), gradient (blue top / gold bottom), per-point z/scale random (more 3D).
 """
 
 import math
 import os
-import struct
 import sys
 from pathlib import Path
 
@@ -25,13 +26,45 @@ except ImportError as e:
     print("Please install dependencies: pip install numpy pillow", file=sys.stderr)
     sys.exit(1)
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 SH_C0 = 0.28209479177387814
+_INV_SH_C0 = 1.0 / SH_C0
+F_REST = 45
+# x,y,z + nx,ny,nz + f_dc_0..2 + f_rest + opacity + scale_0..2 + rot_0..3
+NUM_PROPS = 3 + 3 + 3 + F_REST + 1 + 3 + 4
+# Property declarations are identical for every file; only the vertex count varies
+_PLY_PROPERTY_LINES = b"\n".join(
+    [
+        b"property float x", b"property float y", b"property float z",
+        b"property float nx", b"property float ny", b"property float nz",
+        b"property float f_dc_0", b"property float f_dc_1", b"property float f_dc_2",
+    ]
+    + [b"property float f_rest_%d" % i for i in range(F_REST)]
+    + [
+        b"property float opacity", b"property float scale_0", b"property float scale_1", b"property float scale_2",
+        b"property float rot_0", b"property float rot_1", b"property float rot_2", b"property float rot_3",
+    ]
+)
+
+_rng = np.random.default_rng()
+
+
+def _uniform(low, high, size):
+    """float32 samples in [low, high) from the shared PCG64 generator; bounds may broadcast."""
+    out = _rng.random(size, dtype=np.float32)
+    out *= high - low
+    out += low
+    return out
 
 
 def get_text_points(text, font_path=None, font_size=100, step=1):
     """
     Render text with PIL to an image and extract non-zero pixel coordinates as point cloud.
-    step: sample every step pixels; 1=all, 2=every other.
+    step: sample every step-th pixel column; 1=all, 2=every other.
     """
     try:
         if font_path and os.path.isfile(font_path):
@@ -44,9 +77,12 @@ def get_text_points(text, font_path=None, font_size=100, step=1):
         print(f"Warning: Font load failed {e}, using default", file=sys.stderr)
         font = ImageFont.load_default()
 
-    dummy = Image.new("L", (1, 1))
-    draw = ImageDraw.Draw(dummy)
-    bbox = draw.textbbox((0, 0), text, font=font)
+    # getbbox does not lay out multiline text; textbbox routes it to multiline_textbbox
+    if "\n" not in text and hasattr(font, "getbbox"):
+        bbox = font.getbbox(text)
+    else:
+        dummy = Image.new("L", (1, 1))
+        bbox = ImageDraw.Draw(dummy).textbbox((0, 0), text, font=font)
     w, h = bbox[2] - bbox[0], bbox[3] - bbox[1]
     if w <= 0 or h <= 0:
         w, h = max(1, len(text) * font_size // 2), font_size
@@ -55,12 +91,12 @@ def get_text_points(text, font_path=None, font_size=100, step=1):
     draw = ImageDraw.Draw(image)
     draw.text((0, 0), text, font=font, fill=255)
 
-    data = np.array(image)
-    y_idx, x_idx = np.where(data > 128)
+    data = np.frombuffer(image.tobytes(), dtype=np.uint8).reshape((h, w))
+    # Stride columns before thresholding so only sampled pixels are scanned
+    step = max(1, step)
+    y_idx, x_idx = np.nonzero(data[:, ::step] > 128)
     if step > 1:
-        idx = np.arange(len(y_idx), dtype=np.intp)[::step]
-        y_idx = y_idx[idx]
-        x_idx = x_idx[idx]
+        x_idx *= step
 
     x = x_idx.astype(np.float32)
     y = y_idx.astype(np.float32)   # Keep image Y down, consistent with common 3D view (text not flipped)
@@ -72,20 +108,51 @@ def get_text_points(text, font_path=None, font_size=100, step=1):
     n = len(x)
     # Slight position randomness: xy jitter, z random, to avoid overly uniform layout
     jitter = 0.006
-    x += np.random.uniform(-jitter, jitter, size=n).astype(np.float32)
-    y += np.random.uniform(-jitter, jitter, size=n).astype(np.float32)
-    z = np.random.uniform(-0.004, 0.004, size=n).astype(np.float32)
+    lim = np.array([[jitter], [jitter], [0.004]], dtype=np.float32)
+    noise = _uniform(-lim, lim, (3, n))
+    x += noise[0]
+    y += noise[1]
+    z = noise[2]
     return x, y, z
 
 
-def rgb_to_f_dc(r, g, b):
-    r, g, b = max(0, min(1, r)), max(0, min(1, g)), max(0, min(1, b))
-    return ((r - 0.5) / SH_C0, (g - 0.5) / SH_C0, (b - 0.5) / SH_C0)
+def rgb_to_f_dc(rgb):
+    """RGB in [0,1] (shape (..., 3)) -> SH DC coefficients, keeping the input's float dtype."""
+    f_dc = np.clip(rgb, 0.0, 1.0)
+    f_dc -= 0.5
+    f_dc *= _INV_SH_C0
+    return f_dc
 
 
 def inverse_sigmoid(x):
-    x = max(1e-6, min(1 - 1e-6, x))
-    return math.log(x / (1 - x))
+    """Logit of x (scalar or array), clamped away from 0 and 1."""
+    x = np.clip(x, 1e-6, 1 - 1e-6)
+    return np.log(x / (1 - x))
+
+
+if njit is not None:
+    # Placeholders for per-point inputs that are uniform (already in the template row)
+    _EMPTY = np.empty(0, dtype=np.float32)
+    _EMPTY_ROWS = np.empty((0, 3), dtype=np.float32)
+
+    @njit(parallel=True, cache=True)
+    def _pack_points(out, x, y, z, f_dc, has_f_dc, opacity, has_opacity, scale, has_scale):
+        """
+        Write the per-point columns of the (n, NUM_PROPS) record buffer across all cores.
+        No bounds checking: the caller must validate every input length against n.
+        """
+        for i in prange(x.size):
+            out[i, 0] = x[i]
+            out[i, 1] = y[i]
+            out[i, 2] = z[i]
+            if has_f_dc:
+                for c in range(3):
+                    out[i, 6 + c] = f_dc[i, c]
+            if has_opacity:
+                out[i, 9 + F_REST] = opacity[i]
+            if has_scale:
+                for c in range(3):
+                    out[i, 10 + F_REST + c] = scale[i, c]
 
 
 def write_ply_binary_gaussforge(
@@ -101,60 +168,230 @@ def write_ply_binary_gaussforge(
     """
     Write GaussForge-compatible binary PLY (includes f_rest_0..44).
     color_per_point: (n,3) per-point RGB [0,1]; if None, use color_rgb.
+    opacity: scalar or (n,) per-point opacity in [0,1].
     scale_per_point: (n,3) per-point scale_0,1,2 (log space); if None, use uniform scale_xy/scale_z.
     """
     n = len(x)
-    F_REST = 45
-    header_lines = [
-        "ply", "format binary_little_endian 1.0",
-        "comment GaussForge text",
-        f"element vertex {n}",
-        "property float x", "property float y", "property float z",
-        "property float nx", "property float ny", "property float nz",
-        "property float f_dc_0", "property float f_dc_1", "property float f_dc_2",
-    ]
-    for i in range(F_REST):
-        header_lines.append(f"property float f_rest_{i}")
-    header_lines.extend([
-        "property float opacity", "property float scale_0", "property float scale_1", "property float scale_2",
-        "property float rot_0", "property float rot_1", "property float rot_2", "property float rot_3",
-        "end_header",
-    ])
-    header = "\n".join(header_lines) + "\n"
-    header_bytes = header.encode("ascii")
+    # Validate shapes up front so the NumPy and Numba paths fail the same way
+    # (the Numba kernel does no bounds checking)
+    for name, value, shape in (
+        ("y", y, (n,)),
+        ("z", z, (n,)),
+        ("color_per_point", color_per_point, (n, 3)),
+        ("opacity", opacity, (n,)),
+        ("scale_per_point", scale_per_point, (n, 3)),
+    ):
+        if value is not None and np.ndim(value) != 0 and np.shape(value) != shape:
+            raise ValueError(f"{name} must have shape {shape}, got {np.shape(value)}")
+    header_bytes = b"\n".join([
+        b"ply", b"format binary_little_endian 1.0",
+        b"comment GaussForge text",
+        b"element vertex %d" % n,
+        _PLY_PROPERTY_LINES,
+        b"end_header",
+    ]) + b"\n"
 
     opac_val = inverse_sigmoid(opacity)
     qw, qx, qy, qz = 1.0, 0.0, 0.0, 0.0
     nx, ny, nz = 0.0, 0.0, 1.0
 
+    # One interleaved little-endian float32 record per point. The body is filled
+    # through a memory map so large clouds are not buffered in RAM.
+    with open(out_path, "wb") as f:
+        f.write(header_bytes)
+        f.truncate(len(header_bytes) + n * NUM_PROPS * 4)
+    if n == 0:
+        return n
+
+    # Fields shared by every point (normal, f_rest, rotation and any uniform
+    # color/opacity/scale) go into one template row that is broadcast once;
+    # only the per-point columns are written afterwards.
+    const_row = np.zeros(NUM_PROPS, dtype="<f4")
+    const_row[3:6] = (nx, ny, nz)
+    const_row[13 + F_REST:17 + F_REST] = (qw, qx, qy, qz)
     if color_per_point is None:
-        r, g, b = rgb_to_f_dc(*color_rgb)
-        f_dc = np.zeros((n, 3), dtype=np.float32)
-        f_dc[:, 0], f_dc[:, 1], f_dc[:, 2] = r, g, b
-    else:
+        const_row[6:9] = rgb_to_f_dc(np.asarray(color_rgb, dtype=np.float64))
+    if np.ndim(opac_val) == 0:
+        const_row[9 + F_REST] = opac_val
+    if scale_per_point is None:
+        log_sx = math.log(max(1e-8, scale_xy))
+        log_sz = math.log(max(1e-8, scale_z))
+        const_row[10 + F_REST:13 + F_REST] = (log_sx, log_sx, log_sz)
+
+    buf = np.memmap(out_path, dtype="<f4", mode="r+", offset=len(header_bytes), shape=(n, NUM_PROPS))
+    buf[:] = const_row
+    f_dc = None
+    if color_per_point is not None:
         # Per-point RGB [0,1] -> f_dc
-        rgb = np.clip(color_per_point.astype(np.float64), 0, 1)
-        f_dc = (rgb - 0.5) / SH_C0
-        f_dc = f_dc.astype(np.float32)
+        f_dc = rgb_to_f_dc(np.asarray(color_per_point, dtype=np.float32))
+    if njit is not None:
+        has_opacity = np.ndim(opac_val) != 0
+        _pack_points(
+            buf.view(np.ndarray),
+            np.ascontiguousarray(x, dtype=np.float32),
+            np.ascontiguousarray(y, dtype=np.float32),
+            np.ascontiguousarray(z, dtype=np.float32),
+            _EMPTY_ROWS if f_dc is None else np.ascontiguousarray(f_dc, dtype=np.float32),
+            f_dc is not None,
+            np.ascontiguousarray(opac_val, dtype=np.float32) if has_opacity else _EMPTY,
+            has_opacity,
+            _EMPTY_ROWS if scale_per_point is None else np.ascontiguousarray(scale_per_point, dtype=np.float32),
+            scale_per_point is not None,
+        )
+    else:
+        buf[:, 0] = x
+        buf[:, 1] = y
+        buf[:, 2] = z
+        if f_dc is not None:
+            buf[:, 6:9] = f_dc
+        if np.ndim(opac_val) != 0:
+            buf[:, 9 + F_REST] = opac_val
+        if scale_per_point is not None:
+            buf[:, 10 + F_REST:13 + F_REST] = scale_per_point
+    buf.flush()
+    del buf
+    return n
+
+
+# Compressed PLY: every CHUNK_SIZE points share min/max bounds for quantization
+CHUNK_SIZE = 256
+# Identity quaternion in 2-10-10-10 layout: largest component w (index 0), x/y/z = 0 -> 512/1023
+_PACKED_IDENTITY_ROT = (512 << 20) | (512 << 10) | 512
+_PLY_COMPRESSED_CHUNK_LINES = b"\n".join(
+    b"property float %s" % name
+    for name in (
+        b"min_x", b"min_y", b"min_z", b"max_x", b"max_y", b"max_z",
+        b"min_scale_x", b"min_scale_y", b"min_scale_z", b"max_scale_x", b"max_scale_y", b"max_scale_z",
+        b"min_r", b"min_g", b"min_b", b"max_r", b"max_g", b"max_b",
+    )
+)
+_PLY_COMPRESSED_VERTEX_LINES = b"\n".join([
+    b"property uint packed_position", b"property uint packed_rotation",
+    b"property uint packed_scale", b"property uint packed_color",
+])
+_PLY_COMPRESSED_SH_LINES = b"\n".join(b"property uchar f_rest_%d" % i for i in range(F_REST))
+
+
+def _chunk_bounds(values, n_chunks):
+    """(n,k) values padded with the last row -> (chunks,256,k) view plus per-chunk min/max."""
+    pad = n_chunks * CHUNK_SIZE - len(values)
+    chunks = np.pad(values, ((0, pad), (0, 0)), mode="edge").reshape(n_chunks, CHUNK_SIZE, -1)
+    return chunks, chunks.min(axis=1, keepdims=True), chunks.max(axis=1, keepdims=True)
+
+
+def _quantize(values, lo, hi, bits):
+    """Normalize values into [lo, hi] and round to unsigned `bits`-bit integers."""
+    span = hi - lo
+    flat = span < 1e-5
+    t = (values - lo) / np.where(flat, 1.0, span)
+    t = np.where(flat, 0.0, np.clip(t, 0.0, 1.0))
+    max_val = (1 << bits) - 1
+    return np.floor(t * max_val + 0.5).astype(np.uint32)
+
+
+def _pack_111011(q_x, q_y, q_z):
+    return (q_x << 21) | (q_y << 11) | q_z
 
+
+def write_ply_compressed_gaussforge(
+    out_path,
+    x, y, z,
+    color_rgb=(1.0, 1.0, 1.0),
+    color_per_point=None,
+    opacity=0.95,
+    scale_xy=0.008,
+    scale_z=0.0012,
+    scale_per_point=None,
+    quantize_sh=True,
+):
+    """
+    Write the chunked compressed PLY that GaussForge reads as "compressed.ply".
+    Positions/scales are quantized to 11-10-11 bits and color+opacity to 8 bits each
+    against per-chunk (256 points) bounds stored in a leading "chunk" element.
+    quantize_sh: also write f_rest_0..44 as uchar (so the reader keeps SH degree 3).
+    Other arguments as in write_ply_binary_gaussforge.
+    """
+    n = len(x)
+    n_chunks = (n + CHUNK_SIZE - 1) // CHUNK_SIZE
+    header_lines = [
+        b"ply", b"format binary_little_endian 1.0",
+        b"comment GaussForge text",
+        b"element chunk %d" % n_chunks,
+        _PLY_COMPRESSED_CHUNK_LINES,
+        b"element vertex %d" % n,
+        _PLY_COMPRESSED_VERTEX_LINES,
+    ]
+    if quantize_sh:
+        header_lines += [b"element sh %d" % n, _PLY_COMPRESSED_SH_LINES]
+    header_lines.append(b"end_header")
+    header_bytes = b"\n".join(header_lines) + b"\n"
+    if n == 0:
+        with open(out_path, "wb") as f:
+            f.write(header_bytes)
+        return n
+
+    positions = np.stack([x, y, z], axis=1).astype(np.float32, copy=False)
     if scale_per_point is None:
         log_sx = math.log(max(1e-8, scale_xy))
         log_sz = math.log(max(1e-8, scale_z))
-        scale_per_point = np.array([[log_sx, log_sx, log_sz]] * n, dtype=np.float32)
-
-    with open(out_path, "wb") as f:
-        f.write(header_bytes)
-        for i in range(n):
-            f.write(struct.pack("<3f", float(x[i]), float(y[i]), float(z[i])))
-            f.write(struct.pack("<3f", nx, ny, nz))
-            f.write(struct.pack("<3f", float(f_dc[i, 0]), float(f_dc[i, 1]), float(f_dc[i, 2])))
-            f.write(struct.pack(f"<{F_REST}f", *([0.0] * F_REST)))
-            f.write(struct.pack("<f", opac_val))
-            f.write(struct.pack("<3f", float(scale_per_point[i, 0]), float(scale_per_point[i, 1]), float(scale_per_point[i, 2])))
-            f.write(struct.pack("<4f", qw, qx, qy, qz))
+        scale_per_point = np.broadcast_to(np.array([log_sx, log_sx, log_sz], dtype=np.float32), (n, 3))
+    if color_per_point is None:
+        f_dc = np.broadcast_to(rgb_to_f_dc(np.asarray(color_rgb, dtype=np.float32)), (n, 3))
+    else:
+        f_dc = rgb_to_f_dc(np.asarray(color_per_point, dtype=np.float32))
+    # Color is stored as linear RGB recovered from f_dc, opacity as sigmoid(logit) = clamped opacity
+    colors = f_dc * np.float32(SH_C0) + np.float32(0.5)
+    alpha = np.broadcast_to(np.clip(opacity, 1e-6, 1 - 1e-6), (n,))
+
+    pos_c, pos_lo, pos_hi = _chunk_bounds(positions, n_chunks)
+    scl_c, scl_lo, scl_hi = _chunk_bounds(np.asarray(scale_per_point, dtype=np.float32), n_chunks)
+    np.clip(scl_lo, -20.0, 20.0, out=scl_lo)
+    np.clip(scl_hi, -20.0, 20.0, out=scl_hi)
+    col_c, col_lo, col_hi = _chunk_bounds(colors, n_chunks)
+
+    chunk_data = np.concatenate([pos_lo, pos_hi, scl_lo, scl_hi, col_lo, col_hi], axis=2).reshape(n_chunks, 18)
+
+    q_pos = _quantize(pos_c, pos_lo, pos_hi, np.array([11, 10, 11])).reshape(-1, 3)[:n]
+    q_scl = _quantize(scl_c, scl_lo, scl_hi, np.array([11, 10, 11])).reshape(-1, 3)[:n]
+    q_col = _quantize(col_c, col_lo, col_hi, 8).reshape(-1, 3)[:n]
+    q_alpha = _quantize(alpha, 0.0, 1.0, 8)
+
+    packed = np.empty((n, 4), dtype="<u4")
+    packed[:, 0] = _pack_111011(q_pos[:, 0], q_pos[:, 1], q_pos[:, 2])
+    packed[:, 1] = _PACKED_IDENTITY_ROT
+    packed[:, 2] = _pack_111011(q_scl[:, 0], q_scl[:, 1], q_scl[:, 2])
+    packed[:, 3] = (q_col[:, 0] << 24) | (q_col[:, 1] << 16) | (q_col[:, 2] << 8) | q_alpha
+
+    buffers = [header_bytes, chunk_data.astype("<f4", copy=False), packed]
+    if quantize_sh:
+        # f_rest is all zero: floor((0 / 8 + 0.5) * 256) = 128 in GaussForge's SH quantization
+        buffers.append(np.full((n, F_REST), 128, dtype=np.uint8))
+    _write_buffers(out_path, buffers)
     return n
 
 
+def _write_buffers(out_path, buffers):
+    """Write contiguous buffers to out_path in order; one writev syscall where available."""
+    if not hasattr(os, "writev"):
+        with open(out_path, "wb") as f:
+            for b in buffers:
+                f.write(b)
+        return
+    views = [memoryview(b).cast("B") for b in buffers]
+    fd = os.open(out_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while views:
+            written = os.writev(fd, views)
+            # Short write: drop completed buffers and resume inside the partial one
+            while views and written >= len(views[0]):
+                written -= len(views[0])
+                views.pop(0)
+            if views:
+                views[0] = views[0][written:]
+    finally:
+        os.close(fd)
+
+
 def _hex_to_rgb(hex_str):
     hex_str = hex_str.lstrip("#")
     if len(hex_str) >= 6:
@@ -166,47 +403,48 @@ def _hex_to_rgb(hex_str):
     return (1.0, 1.0, 1.0)
 
 
+# Command-line flag -> (option name, value type); every flag takes one value
+_OPTS = {
+    "-o": ("out_path", Path),
+    "--font": ("font_path", str),
+    "--size": ("font_size", int),
+    "--step": ("step", int),
+    "--color": ("color_hex", str),
+    "--color-top": ("color_top_hex", str),
+    "--color-bottom": ("color_bottom_hex", str),
+}
+
+
 def main():
-    text = "GaussForge"
-    out_path = Path("output_gaussians.ply")
-    font_path = None
-    font_size = 150
-    step = 2
-    color_hex = None
-    color_top_hex = "#87CEEB"
-    color_bottom_hex = "#FFD700"
-    gradient = True
-
-    args = sys.argv[1:]
-    i = 0
-    while i < len(args):
-        if args[i] == "-o" and i + 1 < len(args):
-            out_path = Path(args[i + 1])
-            i += 2
-        elif args[i] == "--font" and i + 1 < len(args):
-            font_path = args[i + 1]
-            i += 2
-        elif args[i] == "--size" and i + 1 < len(args):
-            font_size = int(args[i + 1])
-            i += 2
-        elif args[i] == "--step" and i + 1 < len(args):
-            step = int(args[i + 1])
-            i += 2
-        elif args[i] == "--color" and i + 1 < len(args):
-            color_hex = args[i + 1]
-            gradient = False
-            i += 2
-        elif args[i] == "--color-top" and i + 1 < len(args):
-            color_top_hex = args[i + 1]
-            i += 2
-        elif args[i] == "--color-bottom" and i + 1 < len(args):
-            color_bottom_hex = args[i + 1]
-            i += 2
-        elif not args[i].startswith("-"):
-            text = args[i]
-            i += 1
-        else:
-            i += 1
+    opts = {
+        "text": "GaussForge",
+        "out_path": Path("output_gaussians.ply"),
+        "font_path": None,
+        "font_size": 150,
+        "step": 2,
+        "color_hex": None,
+        "color_top_hex": "#87CEEB",
+        "color_bottom_hex": "#FFD700",
+    }
+    it = iter(sys.argv[1:])
+    for arg in it:
+        if arg in _OPTS:
+            name, cast = _OPTS[arg]
+            value = next(it, None)
+            if value is not None:
+                opts[name] = cast(value)
+        elif not arg.startswith("-"):
+            opts["text"] = arg
+
+    text = opts["text"]
+    out_path = opts["out_path"]
+    font_path = opts["font_path"]
+    font_size = opts["font_size"]
+    step = opts["step"]
+    color_hex = opts["color_hex"]
+    color_top_hex = opts["color_top_hex"]
+    color_bottom_hex = opts["color_bottom_hex"]
+    gradient = color_hex is None  # --color selects a solid color
 
     if not font_path:
         for candidate in [
@@ -230,34 +468,32 @@ def main():
     layer_step = 0.1
     jitter_xy = 0.004
     jitter_z = 0.004
-    new_x, new_y, new_z = [], [], []
-    for i in range(n0):
-        new_x.append(x[i])
-        new_y.append(y[i])
-        new_z.append(z[i])
-        for k in range(1, num_layers + 1):
-            new_x.append(x[i] + np.random.uniform(-jitter_xy, jitter_xy))
-            new_y.append(y[i] + np.random.uniform(-jitter_xy, jitter_xy))
-            new_z.append(z[i] - k * layer_step + np.random.uniform(-jitter_z, jitter_z))
-    x = np.array(new_x, dtype=np.float32)
-    y = np.array(new_y, dtype=np.float32)
-    z = np.array(new_z, dtype=np.float32)
+    # Point i is followed by its layer copies 1..num_layers (k is the layer index)
+    num_copies = num_layers + 1
+    k = np.tile(np.arange(num_copies, dtype=np.float32), n0)
+    x = np.repeat(x, num_copies)
+    y = np.repeat(y, num_copies)
+    z = np.repeat(z, num_copies) - k * np.float32(layer_step)
+    if num_layers > 0:
+        layer = k > 0
+        m = int(np.count_nonzero(layer))
+        lim = np.array([[jitter_xy], [jitter_xy], [jitter_z]], dtype=np.float32)
+        offset = _uniform(-lim, lim, (3, m))
+        x[layer] += offset[0]
+        y[layer] += offset[1]
+        z[layer] += offset[2]
     n = len(x)
 
     # Per-point color: gradient (top->bottom) + slight random
     if gradient:
-        r_top, g_top, b_top = _hex_to_rgb(color_top_hex)
-        r_bot, g_bot, b_bot = _hex_to_rgb(color_bottom_hex)
+        top = np.array(_hex_to_rgb(color_top_hex), dtype=np.float32)
+        bot = np.array(_hex_to_rgb(color_bottom_hex), dtype=np.float32)
         y_min, y_max = float(y.min()), float(y.max())
         y_range = y_max - y_min + 1e-8
-        t = ((y - y_min) / y_range).astype(np.float64)
-        noise = np.random.uniform(-0.06, 0.06, (n, 3))
-        rgb = np.stack([
-            (1 - t) * r_top + t * r_bot + noise[:, 0],
-            (1 - t) * g_top + t * g_bot + noise[:, 1],
-            (1 - t) * b_top + t * b_bot + noise[:, 2],
-        ], axis=1)
-        color_per_point = np.clip(rgb, 0, 1).astype(np.float32)
+        t = ((y - y_min) / y_range).astype(np.float32, copy=False)[:, None]
+        color_per_point = (1 - t) * top + t * bot
+        color_per_point += _uniform(-0.06, 0.06, (n, 3))
+        np.clip(color_per_point, 0, 1, out=color_per_point)
         color_rgb = (0.5, 0.5, 0.5)
     else:
         color_per_point = None
@@ -266,15 +502,25 @@ def main():
     # Per-point scale slightly random for more 3D Gaussian look
     scale_xy_base = 0.016
     scale_z_base = 0.04
-    scale_xy = scale_xy_base * (0.72 + 0.56 * np.random.rand(n)).astype(np.float32)
-    scale_z = scale_z_base * (0.65 + 0.70 * np.random.rand(n)).astype(np.float32)
-    scale_per_point = np.stack([
-        np.log(np.maximum(scale_xy, 1e-8)),
-        np.log(np.maximum(scale_xy, 1e-8)),
-        np.log(np.maximum(scale_z, 1e-8)),
-    ], axis=1)
-
-    n = write_ply_binary_gaussforge(
+    scales = _uniform(
+        np.array([[0.72], [0.65]], dtype=np.float32),
+        np.array([[1.28], [1.35]], dtype=np.float32),
+        (2, n),
+    )
+    scales *= np.array([[scale_xy_base], [scale_z_base]], dtype=np.float32)
+    # Log-space in place; scale_0 and scale_1 share the xy row
+    np.maximum(scales, 1e-8, out=scales)
+    np.log(scales, out=scales)
+    scale_per_point = np.empty((n, 3), dtype=np.float32)
+    scale_per_point[:, 0] = scales[0]
+    scale_per_point[:, 1] = scales[0]
+    scale_per_point[:, 2] = scales[1]
+
+    if out_path.name.endswith(".compressed.ply"):
+        write_ply = write_ply_compressed_gaussforge
+    else:
+        write_ply = write_ply_binary_gaussforge
+    n = write_ply(
         str(out_path), x, y, z,
         color_rgb=color_rgb,
         color_per_point=color_per_point,